@@ -15,7 +15,6 @@ setup(
         'bitstruct',
         'attrs>=17.3.0',
         'structattr',
-        'sortedcontainers',
         'python-dateutil ',
     ],
     setup_requires=[
@@ -1,3 +1,4 @@
+import functools
 import json
 import re
 import typing
@@ -58,6 +59,36 @@ class JsonPatch(list):
         ])
 
 
+class CallbackSet(set):
+    """
+    Set of callbacks that keeps a tuple snapshot of its content.
+
+    Iterating the snapshot is cheaper than iterating the set, and allows
+    callbacks to (un)register callbacks while being called.
+    """
+
+    __slots__ = ['snapshot']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.snapshot = tuple(self)
+
+
+def _update_snapshot(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        ret = method(self, *args, **kwargs)
+        self.snapshot = tuple(self)
+        return ret
+    return wrapper
+
+
+for _method in ['add', 'discard', 'remove', 'pop', 'clear', 'update',
+                'difference_update', 'intersection_update', 'symmetric_difference_update',
+                '__ior__', '__iand__', '__isub__', '__ixor__']:
+    setattr(CallbackSet, _method, _update_snapshot(getattr(set, _method)))
+
+
 class JsonPatchDict(dict):
     """
     Nested dict with callback on update.
@@ -76,14 +107,14 @@ class JsonPatchDict(dict):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.callback = set()
+        self.callback = CallbackSet()
         self._parent = None
 
     def _operation(self, op: JsonPatchOperation):
         if self._parent is not None:
             self._parent(op)
 
-        for cb in self.callback:
+        for cb in self.callback.snapshot:
             cb(JsonPatch([op]))
 
     def __missing__(self, key: str):
@@ -44,6 +44,25 @@ class ModuleStatus8PBU(VelbusMessage):
         Holiday = 3
     program: Program = Program.No
 
+    @property
+    def channel_mask(self) -> int:
+        """
+        All channel_* bitmaps packed in a single int, one byte each:
+        channel_pressed in the least significant byte, up to
+        channel_program_disabled in the most significant one.
+        Bit n of each byte corresponds to channel n+1.
+
+        Handy to compare or query the channel status of two messages at once.
+        """
+        mask = 0
+        for bitmap in (self.channel_program_disabled,
+                       self.channel_locked,
+                       self.channel_not_inverted,
+                       self.channel_enabled,
+                       self.channel_pressed):
+            mask = (mask << 8) | Bitmap(8).to_int(bitmap)
+        return mask
+
 
 @register
 @attr.s(slots=True, auto_attribs=True)
@@ -1,3 +1,6 @@
+import functools
+import struct
+
 import attr
 
 from ._registry import command_registry
@@ -7,6 +10,60 @@ from .UnknownMessage import UnknownMessage
 from .ModuleTypeRequest import ModuleTypeRequest
 
 
+# start-of-frame, priority, address, rtr/data length
+_HEADER = struct.Struct('>BBBB')
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_message(priority: int, remote_transmit_request: bool, data: bytes) -> VelbusMessage:
+    """
+    Decode the data bytes of a frame into the matching VelbusMessage
+
+    Modules repeat identical frames (e.g. status broadcasts) all the time,
+    so the decoded messages are cached: the returned message may be shared
+    between frames and must not be modified.
+    """
+    try:
+        if len(data) == 0:
+            if remote_transmit_request:
+                data = ModuleTypeRequest(
+                    priority=priority,
+                    remote_transmit_request=remote_transmit_request,
+                )
+
+        else:
+            command = data[0]
+            try:
+                candidates = command_registry[command]
+            except KeyError:
+                # Could not decode
+                raise ValueError()
+
+            for c in candidates:
+                try:
+                    data = c.from_bytes(
+                        priority=priority,
+                        remote_transmit_request=remote_transmit_request,
+                        data=data,
+                    )
+                    break
+                except ValueError as e:
+                    pass
+
+        if not isinstance(data, VelbusMessage):
+            raise ValueError()
+
+    except ValueError:
+        # Something went wrong with the decoding, fall back to UnknownMessage
+        data = UnknownMessage(
+            priority=priority,
+            remote_transmit_request=remote_transmit_request,
+            data=data,
+        )
+
+    return data
+
+
 @attr.s(slots=True)
 class VelbusFrame:
     address = attr.ib(converter=UInt(8))
@@ -26,29 +83,28 @@ class VelbusFrame:
         if len(frame) < 6:
             raise BufferError("Not enough data to decode message")
 
-        if frame[0] != 0x0f:
+        start, prio, addr, rtr_dlen = _HEADER.unpack_from(frame)
+
+        if start != 0x0f:
             raise ValueError("data[0] != 0x0f")
 
-        if frame[1] & 0xfc != 0xf8:
+        if prio & 0xfc != 0xf8:
             raise ValueError("data[1] & 0xfc != 0xf8")
-        prio = frame[1] & 0x03
-
-        addr = frame[2]
+        prio &= 0x03
 
-        if frame[3] & 0xb0 != 0x00:
+        if rtr_dlen & 0xb0 != 0x00:
             raise ValueError("data[3] & 0xb0 != 0x00")
-        rtr = bool(frame[3] & 0x40)
-        dlen = frame[3] & 0x0f
+        rtr = bool(rtr_dlen & 0x40)
+        dlen = rtr_dlen & 0x0f
 
         if len(frame) < 4 + dlen + 2:
             raise BufferError("Not enough data to read data bytes")
 
-        data = frame[4:(4 + dlen)]
-
-        checksum_my = 0
-        for b in frame[0:(4 + dlen)]:
-            checksum_my += b
-        checksum_my = (-checksum_my) & 0xff
+        # Slice through a memoryview to avoid copying the frame for the checksum.
+        # The view must be released before a bytearray `frame` can be resized below
+        with memoryview(frame) as view:
+            data = bytes(view[4:(4 + dlen)])
+            checksum_my = (-sum(view[0:(4 + dlen)])) & 0xff
 
         checksum_msg = frame[4 + dlen]
         if checksum_my != checksum_msg:
@@ -66,73 +122,31 @@ class VelbusFrame:
             # message is bytes, not bytearray. ignore
             pass
 
-        # attempt to decode
-        try:
-            if len(data) == 0:
-                if rtr:
-                    data = ModuleTypeRequest(
-                        priority=prio,
-                        remote_transmit_request=rtr,
-                    )
-
-            else:
-                command = data[0]
-                try:
-                    candidates = command_registry[command]
-                except KeyError:
-                    # Could not decode
-                    raise ValueError()
-
-                for c in candidates:
-                    try:
-                        data = c.from_bytes(
-                            priority=prio,
-                            remote_transmit_request=rtr,
-                            data=data,
-                        )
-                        break
-                    except ValueError as e:
-                        pass
-
-            if not isinstance(data, VelbusMessage):
-                raise ValueError()
-
-        except ValueError:
-            # Something went wrong with the decoding, fall back to UnknownMessage
-            data = UnknownMessage(
-                priority=prio,
-                remote_transmit_request=rtr,
-                data=data,
-            )
-
         return cls(
             address=addr,
-            message=data,
+            message=_decode_message(prio, rtr, data),
         )
 
     def to_bytes(self) -> bytes:
         """
         Reconstruct the VelbusFrame
         """
-        m = bytearray(b'\x0f')
-        m.append(0xf8 | self.message._priority)
-        m.append(self.address)
-        b = 0
-        b |= 0x40 if self.message._remote_transmit_request else 0
-
         data = self.message.data()
-        assert len(data) <= 8
-        b |= len(data)
-        m.append(b)
-
-        m += data
-
-        checksum = 0
-        for b in m:
-            checksum += b
-        m.append((-checksum) & 0xff)
+        dlen = len(data)
+        assert dlen <= 8
+
+        m = bytearray(4 + dlen + 2)
+        _HEADER.pack_into(
+            m, 0,
+            0x0f,
+            0xf8 | self.message._priority,
+            self.address,
+            (0x40 if self.message._remote_transmit_request else 0) | dlen,
+        )
+        m[4:(4 + dlen)] = data
 
-        m.append(0x04)
+        m[4 + dlen] = (-sum(m)) & 0xff  # checksum and end byte are still 0 in the sum
+        m[4 + dlen + 1] = 0x04
 
         return m
 
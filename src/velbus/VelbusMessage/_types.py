@@ -24,15 +24,27 @@ import functools
 def Enum(bits: int):
     """
     Returns a Enum-like class with the needed methods
+
+    The members are ints (IntEnum), so they can be compared to and
+    combined with raw integers without unwrapping them first.
     """
-    class EnumBits(enum.Enum):
+    class EnumBits(enum.IntEnum):
+        # Keep the readable `Class.Member` representation of a plain Enum
+        # (IntEnum.__str__ returns the bare number since Python 3.11)
+        __str__ = enum.Enum.__str__
+
         @classmethod
         def bits(cls):
             return bits
 
         @classmethod
         def from_int(cls, data: int):
-            return cls(data)
+            # Look up the member directly instead of going through the
+            # (slow) EnumMeta.__call__ for every decoded field
+            try:
+                return cls._value2member_map_[data]
+            except KeyError:
+                return cls(data)  # may raise ValueError
 
         def to_int(self) -> int:
             return self.value
@@ -70,7 +82,21 @@ def Bytes(num_bytes: int):
 def Bitmap(bits: int):
     """
     Returns a class holding a list of booleans for the given number of bits
+
+    int(bitmap) gives the bits as an integer again, so several bitmaps can be
+    combined with regular integer operations, e.g.
+        int(status.channel_pressed) & int(status.channel_enabled)
     """
+    # Decoding is done per received frame, so precompute all possible
+    # values for small bitmaps instead of looping over the bits every time
+    if bits <= 8:
+        decode_table = tuple(
+            tuple(bool(data & (1 << i)) for i in reversed(range(bits)))
+            for data in range(2 ** bits)
+        )
+    else:
+        decode_table = None
+
     class Bitmap(list):
         @classmethod
         def bits(cls):
@@ -78,19 +104,19 @@ def Bitmap(bits: int):
 
         @classmethod
         def from_int(cls, data: int):
-            v = list()
-            for i in range(bits):
-                v.append(bool(data & 1))
-                data >>= 1
-            return list(reversed(v))
+            if decode_table is not None:
+                return cls(decode_table[data])
+            return cls(bool(data & (1 << i)) for i in reversed(range(bits)))
 
         def to_int(self) -> int:
             out = 0
             for v in self:
-                out <<= 1
-                out |= int(v)
+                out = (out << 1) | bool(v)
             return out
 
+        def __int__(self) -> int:
+            return self.to_int()
+
         @classmethod
         def zero(cls):
             return cls.from_int(0)
@@ -198,10 +224,10 @@ def Index(bits: int, max_bits: int = None):
 
         @classmethod
         def from_int(cls, data: int):
-            for i in range(0, max_bits):
-                if data == 1 << i:
-                    return cls(i + 1)  # 1-based indexing!
-            raise ValueError("0x{:x} does not have exactly 1 bit set".format(data))
+            # data & (data - 1) clears the lowest set bit
+            if data <= 0 or data & (data - 1) or data.bit_length() > max_bits:
+                raise ValueError("0x{:x} does not have exactly 1 bit set".format(data))
+            return cls(data.bit_length())  # 1-based indexing!
 
         def to_int(self) -> int:
             return int(1 << (self - 1))  # 1-based indexing
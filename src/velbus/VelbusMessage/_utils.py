@@ -4,6 +4,7 @@ import structattr
 
 class AttrSerializer:
     _bitstruct_info = None
+    _init_arg_names = None
 
     @classmethod
     def bitstruct_info(cls):
@@ -13,6 +14,19 @@ class AttrSerializer:
                 cls._bitstruct_info.add_attr(a)
         return cls._bitstruct_info
 
+    @classmethod
+    def init_arg_names(cls) -> dict:
+        """
+        Map the data attribute names to their argument name in __init__()
+        (attrs strips the leading underscore of private attributes)
+        """
+        if cls._init_arg_names is None:
+            cls._init_arg_names = {
+                a.name: a.name[1:] if a.name.startswith('_') else a.name
+                for a in cls._data_attributes()
+            }
+        return cls._init_arg_names
+
     def validate(self):
         """
         Validate if the attributes hold valid values, and convert the to the correct type
@@ -32,8 +46,9 @@ class AttrSerializer:
         """
         fields = structattr.deserialize(data, cls.bitstruct_info())
 
-        fields = {k[1:] if k.startswith('_') else k: v for k, v in fields.items()}
-        kwargs.update(fields)
+        init_arg_names = cls.init_arg_names()
+        for name, value in fields.items():
+            kwargs[init_arg_names[name]] = value
 
         return cls(*args, **kwargs)
 
@@ -2,15 +2,14 @@ import asyncio
 import dataclasses
 import datetime
 import functools
-import inspect
-import re
+import heapq
+import itertools
 import typing
 from typing import Callable, Union, Awaitable
 
 import dateutil.parser
 import sanic.response
 import sanic.request
-import sortedcontainers
 
 from ..VelbusProtocol import VelbusProtocol
 from ..VelbusMessage.VelbusFrame import VelbusFrame
@@ -18,6 +17,9 @@ from ..VelbusMessage.ModuleInfo.ModuleInfo import ModuleInfo
 from ..JsonPatchDict import JsonPatchDict
 
 
+_UTC = datetime.timezone.utc
+
+
 @dataclasses.dataclass()
 @functools.total_ordering
 class DelayedCall:
@@ -41,12 +43,12 @@ class DelayedCall:
         elif isinstance(self.when, str):
             self.when = dateutil.parser.parse(self.when)
         elif isinstance(self.when, int) or isinstance(self.when, float):
-            self.when = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(seconds=self.when)
+            self.when = datetime.datetime.now(tz=_UTC) + datetime.timedelta(seconds=self.when)
         else:
             raise TypeError(f"Unrecognized type for `when`: {type(self.when)}")
 
         if self.when is not None and self.when.tzinfo is None:
-            self.when = self.when.replace(tzinfo=datetime.timezone.utc)
+            self.when = self.when.replace(tzinfo=_UTC)
 
     @classmethod
     def from_any(cls, o: typing.Any):
@@ -60,13 +62,12 @@ class DelayedCall:
             return 0
 
         if now is None:
-            now = datetime.datetime.now(tz=datetime.timezone.utc)
-        if now.tzinfo is None:
+            now = datetime.datetime.now(tz=_UTC)
+        elif now.tzinfo is None:
             # assume UTC
-            now = now.replace(tzinfo=datetime.timezone.utc)
+            now = now.replace(tzinfo=_UTC)
 
-        delta = self.when - now
-        return delta.total_seconds()
+        return (self.when - now).total_seconds()
 
     def as_dict(self) -> dict:
         ret = {}
@@ -118,6 +119,11 @@ class DelayedCall:
 
 
 class VelbusModule:
+    # HTTP handlers per (sub)class: {(path, METHOD): method_name}
+    _HANDLER_CACHE: typing.Dict[type, typing.Dict[typing.Tuple[str, str], str]] = {}
+    # HTTP index per (sub)class, as generated by _GET
+    _INDEX_CACHE: typing.Dict[type, str] = {}
+
     def __init__(self,
                  bus: VelbusProtocol,
                  address: int,
@@ -150,7 +156,10 @@ class VelbusModule:
         # It is advisable to keep the structure of `state` and the
         # URL-structure as similar as possible
 
-        self._process_queue = sortedcontainers.SortedList()
+        self._process_queue: typing.List[typing.Tuple[float, int, DelayedCall]] = []
+        # heap of (loop.time() to call at, sequence number, call); the sequence
+        # number keeps the insertion order for equal times, and avoids comparing calls
+        self._process_queue_sequence = itertools.count()
         self._next_delayed_call: typing.Optional[asyncio.TimerHandle] = None
 
     @property
@@ -171,9 +180,40 @@ class VelbusModule:
         """
         pass
 
+    @classmethod
+    def _http_handlers(cls) -> typing.Dict[typing.Tuple[str, str], str]:
+        """
+        Map (path, METHOD) to the name of the method handling it.
+        The methods are defined on the class, so this is only scanned once per class.
+        """
+        try:
+            return VelbusModule._HANDLER_CACHE[cls]
+        except KeyError:
+            pass
+
+        handlers = {}
+        for name in dir(cls):
+            path, sep, method = name.rpartition('_')
+            if sep and method.isalpha() and method.isupper() \
+                    and callable(getattr(cls, name)):
+                handlers[(path, method)] = name
+
+        VelbusModule._HANDLER_CACHE[cls] = handlers
+        return handlers
+
     def lookup_method(self, path_info: str, method: str) -> Callable:
-        method_name = '{}_{}'.format(path_info, method.upper())
-        return getattr(self, method_name)  # may raise AttributeERror
+        """
+        :param path_info: first path component
+        :param method: HTTP method, in ALL CAPS
+        :raises AttributeError if there is no handler for this path & method
+        """
+        try:
+            method_name = self._http_handlers()[(path_info, method)]
+        except KeyError:
+            raise AttributeError("{} has no {} handler for `{}`".format(
+                self.__class__.__name__, method, path_info,
+            ))
+        return getattr(self, method_name)
 
     def dispatch(self,
                  path_info: str,
@@ -196,16 +236,12 @@ class VelbusModule:
         :param bus: to communicate with the Velbus
         :return: sanic.response or an awaitable returning one
         """
-        if path_info == '':
-            path_info = '/'
-
-        module_path = path_info[1:].split('/', 1)  # skip leading /
-        if len(module_path) == 1:
-            module_path.append('')
+        # skip leading / (if any); an empty path_info is handled as '/'
+        method_path, _, path_info = path_info[1:].partition('/')
 
         try:
-            return self.lookup_method(module_path[0], request.method)(
-                path_info=module_path[1],
+            return self.lookup_method(method_path, request.method)(
+                path_info=path_info,
                 request=request,
                 bus=bus,
             )
@@ -223,17 +259,21 @@ class VelbusModule:
         if path_info != '':
             return sanic.response.text('Not found\r\n', status=404)
 
-        # Gerenate index
-        paths = set()
-        for path in dir(self):
-            if path.startswith('_'):
-                continue
-            match = re.match(r'(.+)_([A-Z]+)', path)
-            if not match:
-                continue
-            paths.add(match.group(1))
+        cls = type(self)
+        try:
+            index = VelbusModule._INDEX_CACHE[cls]
+        except KeyError:
+            # Generate index
+            paths = set()
+            for path, _ in self._http_handlers():
+                if path == '' or path.startswith('_'):
+                    continue
+                paths.add(path)
+
+            index = '\r\n'.join(sorted(paths)) + '\r\n'
+            VelbusModule._INDEX_CACHE[cls] = index
 
-        return sanic.response.text('\r\n'.join(sorted(paths)) + '\r\n')
+        return sanic.response.text(index)
 
     def type_GET(self,
                  path_info: str,
@@ -253,17 +293,17 @@ class VelbusModule:
     def delayed_call(self, call_info: DelayedCall) -> typing.Any:
         """
         Function called after a delay.
-        If it returns an awaitable (or is an async function), it is awaited for
+        If it returns a coroutine (i.e. it is an async function), it is awaited for
         """
         raise NotImplementedError("Must be overridden")
 
     def _delayed_call(self) -> None:
-        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        now = asyncio.get_event_loop().time()
 
-        while len(self._process_queue) and self._process_queue[0].seconds_from_now(now) <= 0:
-            call_info = self._process_queue.pop(0)
+        while self._process_queue and self._process_queue[0][0] <= now:
+            _, _, call_info = heapq.heappop(self._process_queue)
             response = self.delayed_call(call_info)
-            if inspect.isawaitable(response):
+            if asyncio.iscoroutine(response):
                 task = asyncio.get_event_loop().create_task(response)
                 task.add_done_callback(lambda result: call_info.future.set_result(result))
             else:
@@ -279,18 +319,29 @@ class VelbusModule:
         if len(self._process_queue) == 0:
             return
 
-        delay = self._process_queue[0].seconds_from_now()
-        self._next_delayed_call = asyncio.get_event_loop().call_later(delay, self._delayed_call)
+        # The queue is keyed on loop.time() already; times in the past run right away
+        self._next_delayed_call = asyncio.get_event_loop().call_at(
+            self._process_queue[0][0], self._delayed_call)
 
     @property
     def delayed_calls(self) -> typing.List[DelayedCall]:
-        return self._process_queue
+        return [call for _, _, call in sorted(self._process_queue)]
 
     @delayed_calls.setter
     def delayed_calls(self, value: typing.Iterable[DelayedCall]):
         self._process_queue.clear()
+
+        # Convert the wall clock `when` to the monotonic clock of the event loop once,
+        # so the queue handling only needs to compare floats
+        loop_now = asyncio.get_event_loop().time()
+        now = datetime.datetime.now(tz=_UTC)
         for call in value:
-            self._process_queue.add(call)
+            if call.when is None:
+                loop_when = float('-inf')  # right away, before all others
+            else:
+                loop_when = loop_now + call.seconds_from_now(now)
+            heapq.heappush(self._process_queue,
+                           (loop_when, next(self._process_queue_sequence), call))
 
         self._schedule_next_delayed_call()
 
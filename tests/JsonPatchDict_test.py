@@ -123,3 +123,19 @@ def test_reconstruct():
 
     a.replace({"hello": "world"})
     assert a == b
+
+
+def test_callback_unregister_during_callback():
+    a = JsonPatchDict()
+
+    operations = []
+
+    def cb(ops: JsonPatch):
+        operations.append(ops)
+        a.callback.discard(cb)
+
+    a.callback.add(cb)
+
+    a['foo'] = 42
+    a['bar'] = 43
+    assert len(operations) == 1
@@ -51,3 +51,11 @@ def test_decode_6in():
     )
 
     assert json.dumps(a.to_json_able())
+
+
+def test_channel_mask_8pbu():
+    b = b'\x0f\xfb\x00\x07\xed\x01\x02\x04\x08\x10\xaa\x39\x04'
+    a = VelbusFrame.from_bytes(b)
+
+    assert a.message.channel_mask == 0x1008040201
+    assert ModuleStatus8PBU().channel_mask == 0
@@ -0,0 +1,60 @@
+import pytest
+
+from velbus.VelbusMessage._types import Bitmap, Enum, Index
+
+
+def test_bitmap_roundtrip():
+    for bits in (2, 8, 12):
+        for value in range(2 ** bits):
+            decoded = Bitmap(bits).from_int(value)
+            assert len(decoded) == bits
+            assert Bitmap(bits)(decoded).to_int() == value
+
+
+def test_bitmap_msb_first():
+    assert Bitmap(8).from_int(0x01) == [False, False, False, False, False, False, False, True]
+    assert Bitmap(8).from_int(0x80) == [True, False, False, False, False, False, False, False]
+
+
+def test_index():
+    assert Index(8).from_int(0x01) == 1
+    assert Index(8).from_int(0x80) == 8
+    assert Index(8)(3).to_int() == 0x04
+
+    for data in (0x00, 0x03, 0x100):
+        with pytest.raises(ValueError):
+            Index(8).from_int(data)
+
+    with pytest.raises(ValueError):
+        Index(8, 5).from_int(0x20)
+
+
+def test_enum():
+    class E(Enum(2)):
+        A = 0
+        B = 2
+
+    assert E.from_int(0) is E.A
+    assert E.from_int(2) is E.B
+    assert E.B.to_int() == 2
+
+    with pytest.raises(ValueError):
+        E.from_int(1)
+
+
+def test_enum_is_int():
+    class E(Enum(2)):
+        A = 0
+        B = 2
+
+    assert E.B == 2
+    assert E.B | 1 == 3
+    assert str(E.B) == 'E.B'
+    assert E.B.to_json_able() == {'name': 'B', 'value': 2}
+
+
+def test_bitmap_int():
+    pressed = Bitmap(8).from_int(0b0110)
+    enabled = Bitmap(8).from_int(0b0011)
+    assert int(pressed) & int(enabled) == 0b0010
+    assert isinstance(pressed, list)